@@ -3,19 +3,102 @@
 Flask Web App - Connects Python Robot Simulator to HTML Interface
 """
 
-from flask import Flask, render_template, jsonify, request
+# Patch socket/threading primitives before anything else imports them
+from gevent import monkey
+monkey.patch_all()
+
+import logging
+
+from gevent.pywsgi import WSGIServer
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import json
+import orjson
 
 # Import your existing RobotSimulator class
-from robot_simulator import RobotSimulator
+from robot_simulator import RobotSimulator, Direction, DIRECTION_NAMES, DEFAULT_OBSTACLES
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that routes jsonify() and request.get_json() through orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response (no str round-trip)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.logger.setLevel(logging.INFO)  # Set to DEBUG to log every robot command
 CORS(app)  # Enable CORS for web requests
 
 # Global robot instance
 robot = RobotSimulator()
 
+# Commands that map straight onto a RobotSimulator method ('reset' is handled
+# separately since it replaces the global robot)
+_COMMANDS = {
+    'forward': RobotSimulator.forward,
+    'backward': RobotSimulator.backward,
+    'left': RobotSimulator.left,
+    'right': RobotSimulator.right,
+    'recharge': RobotSimulator.recharge
+}
+
+# Map direction names to facing values for /api/turn
+_DIR_MAP = {d.name: d.value for d in Direction}
+
+# Serialized /api/status body as (robot, state_version, bytes)
+_status_cache = (None, -1, b'')
+
+# /api/status body with only the variable fields left to fill in
+_STATUS_TEMPLATE = (b'{"success":true,"data":{"x":%d,"y":%d,"facing":"%s","battery":%d,'
+                    b'"moveCount":%d,"obstacles":%s,"gridSize":%d}}')
+_FACING_BYTES = tuple(name.encode() for name in DIRECTION_NAMES)
+
+# Serialized obstacle list as (robot, obstacles_version, bytes)
+_obstacles_cache = (None, -1, b'[]')
+
+def _obstacles_bytes(r):
+    """Return the JSON-encoded obstacle list, re-encoding only when it changed"""
+    global _obstacles_cache
+    cached_robot, version, body = _obstacles_cache
+    if cached_robot is not r or version != r.obstacles_version:
+        body = orjson.dumps(list(r.obstacles))
+        _obstacles_cache = (r, r.obstacles_version, body)
+    return body
+
+def _snapshot():
+    """Build the robot state dict shared by every status-returning endpoint"""
+    r = robot
+    return {
+        'x': r.x,
+        'y': r.y,
+        'facing': r.facing_name,
+        'battery': r.displayed_battery,
+        'moveCount': r.move_count,
+        'obstacles': list(r.obstacles),
+        'gridSize': r.grid_size
+    }
+
+def _request_json():
+    """Parse the POST body with orjson, skipping Flask's get_json() checks.
+
+    Only JSON clients (Content-Type: application/json) are supported; the
+    content type itself is not checked here.
+    """
+    return orjson.loads(request.get_data(cache=False))
+
 @app.route('/')
 def index():
     """Serve the main HTML interface"""
@@ -24,18 +107,18 @@ def index():
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get current robot status"""
-    return jsonify({
-        'success': True,
-        'data': {
-            'x': robot.x,
-            'y': robot.y,
-            'facing': robot.facing.name,
-            'battery': robot.battery_level if robot.enable_battery else 100,
-            'moveCount': len(robot.move_history) - 1,
-            'obstacles': robot.obstacles,
-            'gridSize': robot.grid_size
-        }
-    })
+    global _status_cache
+    r = robot
+    cached_robot, version, body = _status_cache
+    
+    # Only re-serialize when the robot (or its state) has changed
+    if cached_robot is not r or version != r.state_version:
+        body = _STATUS_TEMPLATE % (
+            r.x, r.y, _FACING_BYTES[r.facing], r.displayed_battery,
+            r.move_count, _obstacles_bytes(r), r.grid_size)
+        _status_cache = (r, r.state_version, body)
+    
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/command', methods=['POST'])
 def execute_command():
@@ -44,21 +127,15 @@ def execute_command():
     
     try:
         global robot 
-        data = request.get_json()
+        data = _request_json()
         command = data.get('command', '').lower()
         
-        print(f"Executing command: {command}")  # Debug log
+        app.logger.debug("Executing command: %s", command)
+        
+        handler = _COMMANDS.get(command)
         
-        if command == 'forward':
-            result = robot.forward()
-        elif command == 'backward':
-            result = robot.backward()
-        elif command == 'left':
-            result = robot.left()
-        elif command == 'right':
-            result = robot.right()
-        elif command == 'recharge':
-            result = robot.recharge()
+        if handler is not None:
+            result = handler(robot)
         elif command == 'reset':
             # Reset robot to initial state
             robot = RobotSimulator()
@@ -69,24 +146,17 @@ def execute_command():
                 'message': f'Unknown command: {command}'
             })
         
-        print(f"Result: {result}")  # Debug log
+        app.logger.debug("Result: %s", result)
         
         # Return result with current status
         return jsonify({
             'success': True,
             'message': result,
-            'data': {
-                'x': robot.x,
-                'y': robot.y,
-                'facing': robot.facing.name,
-                'battery': robot.battery_level if robot.enable_battery else 100,
-                'moveCount': len(robot.move_history) - 1,
-                'obstacles': robot.obstacles
-            }
+            'data': _snapshot()
         })
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug log
+        app.logger.error("Error: %s", e)
         return jsonify({
             'success': False,
             'message': f'Error: {str(e)}'
@@ -96,30 +166,23 @@ def execute_command():
 def execute_diagonal():
     """Execute diagonal movement"""
     try:
-        data = request.get_json()
+        data = _request_json()
         direction = data.get('direction', '').lower()
         
-        print(f"Executing diagonal: {direction}")  # Debug log
+        app.logger.debug("Executing diagonal: %s", direction)
         
         result = robot.diagonal_move(direction)
         
-        print(f"Result: {result}")  # Debug log
+        app.logger.debug("Result: %s", result)
         
         return jsonify({
             'success': True,
             'message': result,
-            'data': {
-                'x': robot.x,
-                'y': robot.y,
-                'facing': robot.facing.name,
-                'battery': robot.battery_level if robot.enable_battery else 100,
-                'moveCount': len(robot.move_history) - 1,
-                'obstacles': robot.obstacles
-            }
+            'data': _snapshot()
         })
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug log
+        app.logger.error("Error: %s", e)
         return jsonify({
             'success': False,
             'message': f'Error: {str(e)}'
@@ -129,52 +192,31 @@ def execute_diagonal():
 def turn_to_direction():
     """Turn robot to specific direction"""
     try:
-        data = request.get_json()
+        data = _request_json()
         direction = data.get('direction', '').upper()
         
-        print(f"Turning to: {direction}")  # Debug log
-        
-        # Map direction names to Direction enum values
-        from robot_simulator import Direction
-        direction_map = {
-            'NORTH': Direction.NORTH,
-            'EAST': Direction.EAST,
-            'SOUTH': Direction.SOUTH,
-            'WEST': Direction.WEST
-        }
+        app.logger.debug("Turning to: %s", direction)
         
-        if direction not in direction_map:
+        if direction not in _DIR_MAP:
             return jsonify({
                 'success': False,
                 'message': f'Invalid direction: {direction}'
             })
         
-        target_direction = direction_map[direction]
-        
-        # Turn until facing the right direction
-        turns = 0
-        while robot.facing != target_direction and turns < 4:
-            robot.right()
-            turns += 1
+        # Turning costs no battery and adds no history, so just set the facing
+        robot.face(_DIR_MAP[direction])
         
         result = f"Turned to face {direction}"
-        print(f"Result: {result}")  # Debug log
+        app.logger.debug("Result: %s", result)
         
         return jsonify({
             'success': True,
             'message': result,
-            'data': {
-                'x': robot.x,
-                'y': robot.y,
-                'facing': robot.facing.name,
-                'battery': robot.battery_level if robot.enable_battery else 100,
-                'moveCount': len(robot.move_history) - 1,
-                'obstacles': robot.obstacles
-            }
+            'data': _snapshot()
         })
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug log
+        app.logger.error("Error: %s", e)
         return jsonify({
             'success': False,
             'message': f'Error: {str(e)}'
@@ -184,16 +226,16 @@ def turn_to_direction():
 def modify_obstacles():
     """Add or remove obstacles"""
     try:
-        data = request.get_json()
+        data = _request_json()
         action = data.get('action', '').lower()
         
-        print(f"Obstacle action: {action}")  # Debug log
+        app.logger.debug("Obstacle action: %s", action)
         
         if action == 'clear':
-            robot.obstacles = []
+            robot.set_obstacles(())
             message = 'All obstacles cleared'
         elif action == 'reset':
-            robot.obstacles = [(2, 2), (3, 4), (1, 3)]
+            robot.set_obstacles(DEFAULT_OBSTACLES)
             message = 'Obstacles reset to default'
         elif action == 'toggle':
             x = data.get('x')
@@ -209,26 +251,26 @@ def modify_obstacles():
             # Check if obstacle exists
             obstacle_pos = (x, y)
             if obstacle_pos in robot.obstacles:
-                robot.obstacles.remove(obstacle_pos)
+                robot.remove_obstacle(x, y)
                 message = f'Removed obstacle at ({x}, {y})'
             else:
-                robot.obstacles.append(obstacle_pos)
+                robot.add_obstacle(x, y)
                 message = f'Added obstacle at ({x}, {y})'
         else:
             return jsonify({'success': False, 'message': 'Invalid action'})
         
-        print(f"Result: {message}")  # Debug log
+        app.logger.debug("Result: %s", message)
         
         return jsonify({
             'success': True,
             'message': message,
             'data': {
-                'obstacles': robot.obstacles
+                'obstacles': list(robot.obstacles)
             }
         })
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug log
+        app.logger.error("Error: %s", e)
         return jsonify({
             'success': False,
             'message': f'Error: {str(e)}'
@@ -238,7 +280,7 @@ def modify_obstacles():
 def get_report():
     """Generate detailed robot report"""
     try:
-        print("Generating report...")  # Debug log
+        app.logger.debug("Generating report...")
         
         report = robot.report()
         
@@ -248,7 +290,7 @@ def get_report():
         })
         
     except Exception as e:
-        print(f"Error: {str(e)}")  # Debug log
+        app.logger.error("Error: %s", e)
         return jsonify({
             'success': False,
             'message': f'Error generating report: {str(e)}'
@@ -257,7 +299,7 @@ def get_report():
 if __name__ == '__main__':
     print("Starting Robot Simulator Web Server...")
     print("Open your browser to: http://localhost:5000")
-    print("Watch this console for robot command logs!")
     print("=" * 50)
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Single process on purpose: `robot` is in-process global state
+    WSGIServer(('0.0.0.0', 5000), app).serve_forever()
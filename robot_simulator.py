@@ -5,8 +5,16 @@ A 5x5 grid robot simulator with basic movement and optional enhancements.
 """
 
 import sys
+from collections import deque
 from enum import Enum
-from typing import Tuple, List, Optional
+from typing import Deque, Tuple, Optional, Set
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional: run_script falls back to the interpreted path
+    np = None
+    njit = None
 
 
 class Direction(Enum):
@@ -17,6 +25,109 @@ class Direction(Enum):
     WEST = 3
 
 
+# Facing is stored as a plain int (Direction values) for cheap turns/lookups
+DIRECTION_NAMES = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+_DELTAS = ((0, 1), (1, 0), (0, -1), (-1, 0))  # (dx, dy) per facing
+_DELTAS_REV = ((0, -1), (-1, 0), (0, 1), (1, 0))  # (dx, dy) moving backward
+_DIR_SYMBOLS = ('^', '>', 'v', '<')  # Grid symbol per facing
+_DIAG_MAP = {
+    'ne': (1, 1),   # northeast
+    'se': (1, -1),  # southeast
+    'sw': (-1, -1), # southwest
+    'nw': (-1, 1)   # northwest
+}
+
+MAX_HISTORY = 10000  # Oldest history entries are dropped beyond this
+DEFAULT_OBSTACLES = ((2, 2), (3, 4), (1, 3))
+
+# Position check results returned by RobotSimulator._validate
+_VALID, _OUT_OF_BOUNDS, _OBSTACLE = 0, 1, 2
+
+# Move result messages
+_MSG_MOVED = "Moved {} to ({}, {})"
+_ERR_BATTERY = "ERROR: Insufficient battery to move"
+_ERR_DIAGONAL = "ERROR: Cannot move diagonally to ({}, {})"
+# Move error templates, indexed by _validate result
+_FORWARD_ERRORS = (
+    None,
+    "ERROR: Cannot move to ({}, {}) - outside grid boundaries",
+    "ERROR: Cannot move to ({}, {}) - obstacle present"
+)
+_BACKWARD_ERRORS = (
+    None,
+    "ERROR: Cannot move backward to ({}, {}) - outside grid boundaries",
+    "ERROR: Cannot move backward to ({}, {}) - obstacle present"
+)
+_DIAGONAL_ERRORS = (None, _ERR_DIAGONAL, _ERR_DIAGONAL)
+
+# Script command codes used by RobotSimulator.run_script:
+# 0=forward, 1=backward, 2=left, 3=right, 4..7=ne/se/sw/nw
+_SCRIPT_DIAGONALS = ('ne', 'se', 'sw', 'nw')
+_SCRIPT_CODES = {
+    'forward': 0, 'f': 0,
+    'backward': 1, 'back': 1, 'b': 1,
+    'left': 2, 'l': 2,
+    'right': 3, 'r': 3,
+    'ne': 4, 'se': 5, 'sw': 6, 'nw': 7
+}
+
+
+def _simulate(cmds, deltas, x, y, facing, obstacle_mask, n, battery, drain, out):
+    """
+    Run a tokenized command script (compiled with numba when available).
+    
+    Mirrors the rules of RobotSimulator._move: moves that would leave the
+    grid, hit an obstacle or need more battery than is left are skipped.
+    
+    Args:
+        cmds: uint8 array of script command codes
+        deltas: (4, 8, 2) array of (dx, dy) per facing and command code
+        x, y, facing: Starting state
+        obstacle_mask: Obstacle bitmask (0 when obstacles are disabled)
+        n: Grid size
+        battery: Starting battery level, or -1 when battery is disabled
+        drain: Battery used per move
+        out: (len(cmds), 3) array that receives (x, y, facing) per move
+        
+    Returns:
+        tuple: Final (x, y, facing, moves made, battery)
+    """
+    moves = 0
+    for i in range(cmds.shape[0]):
+        c = cmds[i]
+        if c == 2:
+            facing = (facing - 1) & 3
+        elif c == 3:
+            facing = (facing + 1) & 3
+        elif battery < 0 or battery >= drain:
+            nx = x + deltas[facing, c, 0]
+            ny = y + deltas[facing, c, 1]
+            if 0 <= nx < n and 0 <= ny < n and not ((obstacle_mask >> (ny * n + nx)) & 1):
+                x, y = nx, ny
+                if battery >= 0:
+                    battery = max(0, battery - drain)
+                out[moves, 0] = x
+                out[moves, 1] = y
+                out[moves, 2] = facing
+                moves += 1
+    return x, y, facing, moves, battery
+
+
+if njit is not None:
+    _simulate_jit = njit(_simulate)
+    
+    # [facing][command code] -> (dx, dy); turns (codes 2, 3) have no delta
+    _SCRIPT_DELTAS = np.zeros((4, 8, 2), dtype=np.int64)
+    for _f in range(4):
+        _SCRIPT_DELTAS[_f, 0] = _DELTAS[_f]
+        _SCRIPT_DELTAS[_f, 1] = _DELTAS_REV[_f]
+        for _i, _d in enumerate(_SCRIPT_DIAGONALS):
+            _SCRIPT_DELTAS[_f, 4 + _i] = _DIAG_MAP[_d]
+    del _f, _i, _d
+else:
+    _simulate_jit = None
+
+
 class RobotSimulator:
     """
     A robot simulator that operates on a 5x5 grid.
@@ -35,31 +146,39 @@ class RobotSimulator:
             enable_obstacles: Enable obstacle placement
         """
         self.grid_size = grid_size
+        self.state_version = 0  # Bumped on every state change (for caching)
+        self.obstacles_version = 0  # Bumped when the obstacle set changes
         self.x = 0  # Starting X position
         self.y = 0  # Starting Y position
-        self.facing = Direction.NORTH  # Starting direction
+        self.facing = Direction.NORTH.value  # Starting direction (int 0..3)
+        self.facing_name = DIRECTION_NAMES[self.facing]  # Kept in sync on every turn
         
         # Optional features
         self.enable_battery = enable_battery
         self.battery_level = 100 if enable_battery else None
         self.battery_drain_per_move = 5
+        # Battery value reported to clients (always 100 when disabled)
+        self.displayed_battery = 100
         
         # Obstacles (optional enhancement)
         self.enable_obstacles = enable_obstacles
-        self.obstacles: List[Tuple[int, int]] = []
+        self.obstacles: Set[Tuple[int, int]] = set()
+        self._obstacle_mask = 0  # Bit (y * grid_size + x) set for each obstacle cell
         if enable_obstacles:
             # Add some default obstacles
-            self.obstacles = [(2, 2), (3, 4), (1, 3)]
+            self.set_obstacles(DEFAULT_OBSTACLES)
         
-        # Movement history for tracking
-        self.move_history: List[Tuple[int, int, Direction]] = []
-        self._record_position()
+        # Movement history for tracking (starting position is not a move)
+        self.move_history: Deque[Tuple[int, int, int]] = deque(
+            [(self.x, self.y, self.facing)], maxlen=MAX_HISTORY)
+        self.move_count = 0
         
     def _record_position(self):
-        """Record current position and direction in history."""
+        """Record current position and direction in history and count the move."""
         self.move_history.append((self.x, self.y, self.facing))
+        self.move_count += 1
     
-    def _is_valid_position(self, x: int, y: int) -> bool:
+    def _validate(self, x: int, y: int) -> int:
         """
         Check if a position is valid (within grid and not an obstacle).
         
@@ -68,38 +187,35 @@ class RobotSimulator:
             y: Y coordinate
             
         Returns:
-            bool: True if position is valid
+            int: _VALID, or _OUT_OF_BOUNDS / _OBSTACLE giving the reason it is not
         """
+        n = self.grid_size
+        
         # Check grid boundaries
-        if not (0 <= x < self.grid_size and 0 <= y < self.grid_size):
-            return False
+        if not (0 <= x < n and 0 <= y < n):
+            return _OUT_OF_BOUNDS
         
         # Check obstacles
-        if self.enable_obstacles and (x, y) in self.obstacles:
-            return False
+        if self.enable_obstacles and (self._obstacle_mask >> (y * n + x)) & 1:
+            return _OBSTACLE
         
-        return True
+        return _VALID
     
-    def _get_next_position(self, reverse: bool = False) -> Tuple[int, int]:
+    def _bit(self, x: int, y: int) -> int:
         """
-        Get the next position based on current facing direction.
+        Get the obstacle mask bit for a cell.
         
         Args:
-            reverse: If True, get position behind the robot
+            x: X coordinate
+            y: Y coordinate
             
         Returns:
-            Tuple[int, int]: Next (x, y) position
-        """
-        multiplier = -1 if reverse else 1
-        
-        if self.facing == Direction.NORTH:
-            return (self.x, self.y + (1 * multiplier))
-        elif self.facing == Direction.EAST:
-            return (self.x + (1 * multiplier), self.y)
-        elif self.facing == Direction.SOUTH:
-            return (self.x, self.y - (1 * multiplier))
-        elif self.facing == Direction.WEST:
-            return (self.x - (1 * multiplier), self.y)
+            int: Mask bit for the cell, or 0 if it is outside the grid
+        """
+        n = self.grid_size
+        if not (0 <= x < n and 0 <= y < n):
+            return 0
+        return 1 << (y * n + x)
     
     def _check_battery(self) -> bool:
         """
@@ -116,6 +232,66 @@ class RobotSimulator:
         """Consume battery for a move."""
         if self.enable_battery:
             self.battery_level = max(0, self.battery_level - self.battery_drain_per_move)
+            self.displayed_battery = self.battery_level
+    
+    def set_obstacles(self, obstacles) -> None:
+        """
+        Replace all obstacles.
+        
+        Args:
+            obstacles: Iterable of (x, y) obstacle positions
+        """
+        self.obstacles = set(obstacles)
+        self._obstacle_mask = 0
+        for x, y in self.obstacles:
+            self._obstacle_mask |= self._bit(x, y)
+        self.state_version += 1
+        self.obstacles_version += 1
+    
+    def add_obstacle(self, x: int, y: int) -> None:
+        """Add an obstacle at (x, y)."""
+        self._obstacle_mask |= self._bit(x, y)
+        self.obstacles.add((x, y))
+        self.state_version += 1
+        self.obstacles_version += 1
+    
+    def remove_obstacle(self, x: int, y: int) -> None:
+        """Remove the obstacle at (x, y)."""
+        self._obstacle_mask &= ~self._bit(x, y)
+        self.obstacles.discard((x, y))
+        self.state_version += 1
+        self.obstacles_version += 1
+    
+    def _move(self, dx: int, dy: int, label: str, errors: Tuple) -> str:
+        """
+        Move the robot by (dx, dy), shared by all movement commands.
+        
+        Args:
+            dx: Change in X
+            dy: Change in Y
+            label: How the move is described in the success message
+            errors: Error templates indexed by the _validate result
+            
+        Returns:
+            str: Status message about the move
+        """
+        # Check battery
+        if not self._check_battery():
+            return _ERR_BATTERY
+        
+        # Validate position
+        next_x, next_y = self.x + dx, self.y + dy
+        code = self._validate(next_x, next_y)
+        if code != _VALID:
+            return errors[code].format(next_x, next_y)
+        
+        # Execute move
+        self.x, self.y = next_x, next_y
+        self._consume_battery()
+        self._record_position()
+        self.state_version += 1
+        
+        return _MSG_MOVED.format(label, next_x, next_y)
     
     def forward(self) -> str:
         """
@@ -124,30 +300,8 @@ class RobotSimulator:
         Returns:
             str: Status message about the move
         """
-        try:
-            # Check battery
-            if not self._check_battery():
-                return "ERROR: Insufficient battery to move"
-            
-            # Calculate next position
-            next_x, next_y = self._get_next_position()
-            
-            # Validate position
-            if not self._is_valid_position(next_x, next_y):
-                if (next_x, next_y) in self.obstacles:
-                    return f"ERROR: Cannot move to ({next_x}, {next_y}) - obstacle present"
-                else:
-                    return f"ERROR: Cannot move to ({next_x}, {next_y}) - outside grid boundaries"
-            
-            # Execute move
-            self.x, self.y = next_x, next_y
-            self._consume_battery()
-            self._record_position()
-            
-            return f"Moved forward to ({self.x}, {self.y})"
-            
-        except Exception as e:
-            return f"ERROR: Unexpected error during forward movement: {str(e)}"
+        dx, dy = _DELTAS[self.facing]
+        return self._move(dx, dy, 'forward', _FORWARD_ERRORS)
     
     def backward(self) -> str:
         """
@@ -156,30 +310,8 @@ class RobotSimulator:
         Returns:
             str: Status message about the move
         """
-        try:
-            # Check battery
-            if not self._check_battery():
-                return "ERROR: Insufficient battery to move"
-            
-            # Calculate backward position (reverse=True)
-            next_x, next_y = self._get_next_position(reverse=True)
-            
-            # Validate position
-            if not self._is_valid_position(next_x, next_y):
-                if (next_x, next_y) in self.obstacles:
-                    return f"ERROR: Cannot move backward to ({next_x}, {next_y}) - obstacle present"
-                else:
-                    return f"ERROR: Cannot move backward to ({next_x}, {next_y}) - outside grid boundaries"
-            
-            # Execute move
-            self.x, self.y = next_x, next_y
-            self._consume_battery()
-            self._record_position()
-            
-            return f"Moved backward to ({self.x}, {self.y})"
-            
-        except Exception as e:
-            return f"ERROR: Unexpected error during backward movement: {str(e)}"
+        dx, dy = _DELTAS_REV[self.facing]
+        return self._move(dx, dy, 'backward', _BACKWARD_ERRORS)
     
     def left(self) -> str:
         """
@@ -188,11 +320,10 @@ class RobotSimulator:
         Returns:
             str: Status message about the turn
         """
-        try:
-            self.facing = Direction((self.facing.value - 1) % 4)
-            return f"Turned left, now facing {self.facing.name}"
-        except Exception as e:
-            return f"ERROR: Unexpected error during left turn: {str(e)}"
+        self.facing = (self.facing - 1) & 3
+        self.facing_name = DIRECTION_NAMES[self.facing]
+        self.state_version += 1
+        return f"Turned left, now facing {self.facing_name}"
     
     def right(self) -> str:
         """
@@ -201,11 +332,21 @@ class RobotSimulator:
         Returns:
             str: Status message about the turn
         """
-        try:
-            self.facing = Direction((self.facing.value + 1) % 4)
-            return f"Turned right, now facing {self.facing.name}"
-        except Exception as e:
-            return f"ERROR: Unexpected error during right turn: {str(e)}"
+        self.facing = (self.facing + 1) & 3
+        self.facing_name = DIRECTION_NAMES[self.facing]
+        self.state_version += 1
+        return f"Turned right, now facing {self.facing_name}"
+    
+    def face(self, facing: int) -> None:
+        """
+        Turn the robot to face a direction directly.
+        
+        Args:
+            facing: Direction value (0..3) to face
+        """
+        self.facing = facing
+        self.facing_name = DIRECTION_NAMES[facing]
+        self.state_version += 1
     
     def report(self) -> str:
         """
@@ -214,27 +355,23 @@ class RobotSimulator:
         Returns:
             str: Detailed status report
         """
-        try:
-            report_lines = [
-                f"Robot Status Report:",
-                f"Position: ({self.x}, {self.y})",
-                f"Facing: {self.facing.name}",
-                f"Grid Size: {self.grid_size}x{self.grid_size}"
-            ]
-            
-            if self.enable_battery:
-                battery_status = "CRITICAL" if self.battery_level <= 20 else "OK"
-                report_lines.append(f"Battery: {self.battery_level}% ({battery_status})")
-            
-            if self.enable_obstacles:
-                report_lines.append(f"Obstacles at: {self.obstacles}")
-            
-            report_lines.append(f"Total moves: {len(self.move_history) - 1}")
-            
-            return "\n".join(report_lines)
-            
-        except Exception as e:
-            return f"ERROR: Could not generate report: {str(e)}"
+        report_lines = [
+            f"Robot Status Report:",
+            f"Position: ({self.x}, {self.y})",
+            f"Facing: {self.facing_name}",
+            f"Grid Size: {self.grid_size}x{self.grid_size}"
+        ]
+        
+        if self.enable_battery:
+            battery_status = "CRITICAL" if self.battery_level <= 20 else "OK"
+            report_lines.append(f"Battery: {self.battery_level}% ({battery_status})")
+        
+        if self.enable_obstacles:
+            report_lines.append(f"Obstacles at: {sorted(self.obstacles)}")
+        
+        report_lines.append(f"Total moves: {self.move_count}")
+        
+        return "\n".join(report_lines)
     
     def diagonal_move(self, direction: str) -> str:
         """
@@ -246,34 +383,72 @@ class RobotSimulator:
         Returns:
             str: Status message about the move
         """
-        try:
-            if not self._check_battery():
-                return "ERROR: Insufficient battery to move"
-            
-            direction_map = {
-                'ne': (1, 1),   # northeast
-                'se': (1, -1),  # southeast
-                'sw': (-1, -1), # southwest
-                'nw': (-1, 1)   # northwest
-            }
-            
-            if direction.lower() not in direction_map:
-                return "ERROR: Invalid diagonal direction. Use: ne, se, sw, nw"
-            
-            dx, dy = direction_map[direction.lower()]
-            next_x, next_y = self.x + dx, self.y + dy
-            
-            if not self._is_valid_position(next_x, next_y):
-                return f"ERROR: Cannot move diagonally to ({next_x}, {next_y})"
-            
-            self.x, self.y = next_x, next_y
-            self._consume_battery()
-            self._record_position()
-            
-            return f"Moved diagonally {direction.upper()} to ({self.x}, {self.y})"
+        delta = _DIAG_MAP.get(direction.lower())
+        if delta is None:
+            return "ERROR: Invalid diagonal direction. Use: ne, se, sw, nw"
+        
+        dx, dy = delta
+        return self._move(dx, dy, f"diagonally {direction.upper()}", _DIAGONAL_ERRORS)
+    
+    def run_script(self, commands: str) -> str:
+        """
+        Run a sequence of movement commands in one go.
+        
+        Commands are separated by spaces or commas and use the same names as
+        the interactive commands (forward/f, backward/back/b, left/l, right/r)
+        plus ne/se/sw/nw for diagonal moves. Uses a numba-compiled loop when
+        numba is installed, otherwise runs each command normally.
+        
+        Args:
+            commands: Command sequence, e.g. "f f r f ne"
             
-        except Exception as e:
-            return f"ERROR: Unexpected error during diagonal movement: {str(e)}"
+        Returns:
+            str: Summary of the run
+        """
+        tokens = commands.replace(',', ' ').lower().split()
+        if not tokens:
+            return "ERROR: Empty script"
+        
+        codes = []
+        for token in tokens:
+            code = _SCRIPT_CODES.get(token)
+            if code is None:
+                return f"ERROR: Unknown script command '{token}'"
+            codes.append(code)
+        
+        n = self.grid_size
+        start_moves = self.move_count
+        
+        # The obstacle bitmask has to fit in an int64 for the compiled loop
+        if _simulate_jit is not None and n * n <= 63:
+            cmds = np.frombuffer(bytes(codes), dtype=np.uint8)
+            out = np.empty((len(codes), 3), dtype=np.int64)
+            battery = self.battery_level if self.enable_battery else -1
+            mask = self._obstacle_mask if self.enable_obstacles else 0
+            
+            x, y, facing, moves, battery = _simulate_jit(
+                cmds, _SCRIPT_DELTAS, self.x, self.y, self.facing, mask, n,
+                battery, self.battery_drain_per_move, out)
+            
+            self.x, self.y, self.facing = int(x), int(y), int(facing)
+            self.facing_name = DIRECTION_NAMES[self.facing]
+            if self.enable_battery:
+                self.battery_level = int(battery)
+                self.displayed_battery = self.battery_level
+            self.move_history.extend(map(tuple, out[:moves].tolist()))
+            self.move_count += int(moves)
+            self.state_version += 1
+        else:
+            steps = (RobotSimulator.forward, RobotSimulator.backward,
+                     RobotSimulator.left, RobotSimulator.right)
+            for code in codes:
+                if code < 4:
+                    steps[code](self)
+                else:
+                    self.diagonal_move(_SCRIPT_DIAGONALS[code - 4])
+        
+        return (f"Ran {len(codes)} commands ({self.move_count - start_moves} moves), "
+                f"now at ({self.x}, {self.y}) facing {self.facing_name}")
     
     def display_grid(self) -> str:
         """
@@ -283,38 +458,32 @@ class RobotSimulator:
             str: ASCII representation of the grid
         """
         try:
-            print("\n" + "="*25)
-            print("   CURRENT GRID STATE")
-            print("="*25)
+            n = self.grid_size
+            symbol = _DIR_SYMBOLS[self.facing]
+            obstacles = self.obstacles
+            lines = ["\n" + "="*25, "   CURRENT GRID STATE", "="*25]
             
             # Display from top to bottom (y decreases)
-            for y in range(self.grid_size - 1, -1, -1):
-                row = []
-                for x in range(self.grid_size):
-                    if x == self.x and y == self.y:
-                        # Robot position with direction
-                        direction_symbols = {
-                            Direction.NORTH: '^',
-                            Direction.EAST: '>',
-                            Direction.SOUTH: 'v',
-                            Direction.WEST: '<'
-                        }
-                        row.append(direction_symbols[self.facing])
-                    elif (x, y) in self.obstacles:
-                        row.append('X')  # Obstacle
-                    else:
-                        row.append('.')  # Empty space
-                row_str = ' '.join(row)
-                print(f"{y} | {row_str}")
+            for y in range(n - 1, -1, -1):
+                row_str = ' '.join(
+                    symbol if (x == self.x and y == self.y)  # Robot position with direction
+                    else 'X' if (x, y) in obstacles          # Obstacle
+                    else '.'                                 # Empty space
+                    for x in range(n))
+                lines.append(f"{y} | {row_str}")
             
             # Add x-axis labels
-            print('  +' + '-' * (self.grid_size * 2))
-            x_labels = '  | ' + ' '.join(str(i) for i in range(self.grid_size))
-            print(x_labels)
-            print()
-            print("Legend: ^ > v < = Robot facing direction")
-            print("        X = Obstacle, . = Empty space")
-            print("="*25)
+            lines.append('  +' + '-' * (n * 2))
+            lines.append('  | ' + ' '.join(str(i) for i in range(n)))
+            lines.append("")
+            lines.append("Legend: ^ > v < = Robot facing direction")
+            lines.append("        X = Obstacle, . = Empty space")
+            lines.append("="*25)
+            
+            # Write the whole grid at once rather than one print per line
+            grid = "\n".join(lines)
+            sys.stdout.write(grid + "\n")
+            return grid
             
         except Exception as e:
             print(f"ERROR: Could not display grid: {str(e)}")
@@ -330,6 +499,8 @@ class RobotSimulator:
             return "Battery system is disabled"
         
         self.battery_level = 100
+        self.displayed_battery = 100
+        self.state_version += 1
         return "Battery recharged to 100%"
     
     def execute_command(self, command: str) -> str:
@@ -348,31 +519,21 @@ class RobotSimulator:
             result = ""
             show_grid = False  # Flag to determine if we should show grid
             
-            if command == 'forward' or command == 'f':
-                result = self.forward()
-                show_grid = True
-            elif command == 'backward' or command == 'back' or command == 'b':
-                result = self.backward()
-                show_grid = True
-            elif command == 'left' or command == 'l':
-                result = self.left()
-                show_grid = True
-            elif command == 'right' or command == 'r':
-                result = self.right()
-                show_grid = True
-            elif command == 'report':
-                result = self.report()
-            elif command == 'recharge':
-                result = self.recharge()
+            handler = self._COMMANDS.get(command)
+            
+            if handler is not None:
+                method, show_grid = handler
+                result = method(self)
             elif command.startswith('diagonal '):
                 direction = command.split()[1]
                 result = self.diagonal_move(direction)
                 show_grid = True
+            elif command.startswith('script '):
+                result = self.run_script(command[len('script '):])
+                show_grid = True
             elif command == 'grid':
                 self.display_grid()
                 result = "Grid displayed above"
-            elif command == 'help':
-                result = self.get_help()
             else:
                 result = f"ERROR: Unknown command '{command}'. Type 'help' for available commands."
             
@@ -401,11 +562,28 @@ class RobotSimulator:
             "  report          - Show robot status",
             "  grid            - Display current grid",
             "  diagonal <dir>  - Move diagonally (ne/se/sw/nw)",
+            "  script <cmds>   - Run a command sequence (e.g. f f r ne)",
             "  recharge        - Recharge battery to 100%",
             "  help            - Show this help",
             "  quit            - Exit simulator"
         ]
         return '\n'.join(help_text)
+    
+    # Command name/alias -> (method, show grid afterwards)
+    _COMMANDS = {
+        'forward': (forward, True),
+        'f': (forward, True),
+        'backward': (backward, True),
+        'back': (backward, True),
+        'b': (backward, True),
+        'left': (left, True),
+        'l': (left, True),
+        'right': (right, True),
+        'r': (right, True),
+        'report': (report, False),
+        'recharge': (recharge, False),
+        'help': (get_help, False)
+    }
 
 
 def main():